@@ -13,9 +13,9 @@ from pathlib import Path
 
 # Add src directory to path if running as script
 if __name__ == "__main__":
-    src_dir = Path(__file__).parent.parent.parent  # src/modelgarden/agents -> src/
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
+    src_dir = str(Path(__file__).parent.parent.parent)  # src/modelgarden/agents -> src/
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
 
 import dspy
 from modelgarden.mcp_loader.loader import load_enabled_mcp_servers
@@ -72,22 +72,29 @@ Output contract
 class MCPAgent:
     def __init__(self, model: dspy.LM | None = None) -> None:
         self.model = model or dspy.settings.lm
+        # Built on first run and reused: starting MCP servers and assembling
+        # the ReAct program are the expensive parts of a run.
+        self._react: dspy.ReAct | None = None
 
-    def run(self, task_context: str) -> AgentResult:
+    def _get_react(self) -> dspy.ReAct:
+        if self._react is None:
+            # 1) Load MCP servers + global allow/deny filter
+            bundle = load_enabled_mcp_servers()
 
-        logger = logging.getLogger("modelgarden.agents")
+            # 2) Build DSPy toolset (MCP + core.* filtered by allow_fn)
+            tools = build_toolset(bundle)
 
-        # 1) Load MCP servers + global allow/deny filter
-        bundle = load_enabled_mcp_servers()
+            self._react = dspy.ReAct(MCPTaskSignature, tools=tools, max_iters=30)
+        return self._react
 
-        # 2) Build DSPy toolset (MCP + core.* filtered by allow_fn)
-        tools = build_toolset(bundle)
+    def run(self, task_context: str) -> AgentResult:
 
+        logger = logging.getLogger("modelgarden.agents")
 
+        react = self._get_react()
 
         # 3) Run ReAct program
         with dspy.context(lm=self.model):
-            react = dspy.ReAct(MCPTaskSignature, tools=tools, max_iters=30)
             result = react(
                 task_context=task_context,
             )
@@ -96,4 +103,4 @@ class MCPAgent:
             success=True,
             message=result.summary,
             artifact_uri= None,
-        )
\ No newline at end of file
+        )
@@ -1,3 +1,5 @@
+import io
+
 import dspy
 from typing import Optional, List, Dict
 
@@ -110,10 +112,12 @@ Evaluation Checklist
 ✅ Independent of the user’s main objective
 ✅ Covers a diverse range of contribution types
     """
+    # Inputs are ordered stable -> volatile (scratchpad and todo list last) so
+    # repeat calls for a project share a long, provider-cacheable prompt prefix.
     user_profile: str = dspy.InputField(description="A description of the user and their goals for collaboration with the agent")
     project_name: str = dspy.InputField(description="The name of the project that the user is currently working on")
-    project_scratchpad: str = dspy.InputField(description="The current rendered project scratchpad with all the information we know about the project")
     project_description: Optional[str] = dspy.InputField(description="A description of the project that the user is currently working on from their own perspective")
+    project_scratchpad: str = dspy.InputField(description="The current rendered project scratchpad with all the information we know about the project")
     important_todo_list: str = dspy.InputField(description="A list of important todos that the user is trying to complete in order to achieve their high level project goals.  You should take inspiration from this list in proposing your background agent tasks.")
     tasks: List[str] = dspy.OutputField(description="A list of tasks that a background agent would be especially helpful for completing to push the user towards achieving their high level project goals.")
 
@@ -121,10 +125,12 @@ def organize_milestones(milestones: Dict[str, List[str]]) -> str:
     """
     Convert the dictionary of high level goals and their milestones into a string that can be provided to the background agent.
     """
-    parts = []
-    for goal, milestones in milestones.items():
-        parts.append(f"## {goal}")
-        for milestone in milestones:
-            parts.append(f"  - [ ] {milestone}")
-        parts.append("")
-    return "\n".join(parts)
\ No newline at end of file
+    buf = io.StringIO()
+    write = buf.write
+    for i, (goal, goal_milestones) in enumerate(milestones.items()):
+        if i:
+            write("\n")
+        write(f"## {goal}\n")
+        for milestone in goal_milestones:
+            write(f"  - [ ] {milestone}\n")
+    return buf.getvalue()
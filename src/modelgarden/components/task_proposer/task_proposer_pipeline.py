@@ -1,4 +1,5 @@
 
+import re
 from typing import List, Dict, Optional
 
 import dspy
@@ -9,6 +10,27 @@ from precursor.components.task_proposer.task_scorer import BatchedTaskScorer, Ta
 from precursor.components.task_proposer.agent_task_proposer import BackgroundAgentTaskProposer
 
 
+_TRAILING_WS_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
+def _compact_scratchpad(text: str) -> str:
+    """
+    Drop trailing whitespace and collapse runs of blank lines. The scratchpad is
+    sent to every stage of the pipeline, so this trims each prompt without
+    changing its content.
+    """
+    text = _TRAILING_WS_RE.sub("", text)
+    return _BLANK_RUN_RE.sub("\n\n", text).strip()
+
+
+def _clean_items(items: Optional[List[str]]) -> List[str]:
+    """
+    Strip each item and drop empties in a single pass.
+    """
+    return [s for s in (x.strip() for x in (items or []) if x) if s]
+
+
 def _render_goal_milestones_checklist(goal_to_milestones: Dict[str, List[str]]) -> str:
     """
     Render a mapping of {high_level_goal: [milestones...]} into a simple checklist string
@@ -18,7 +40,7 @@ def _render_goal_milestones_checklist(goal_to_milestones: Dict[str, List[str]])
         return ""
     lines: List[str] = []
     for goal, milestones in goal_to_milestones.items():
-        clean = [m.strip() for m in (milestones or []) if m]
+        clean = _clean_items(milestones)
         if not clean:
             continue
         lines.append(f"## {goal}")
@@ -66,6 +88,8 @@ class TaskProposerPipeline(dspy.Module):
         project_description: Optional[str] = None,
         user_agent_goals: Optional[str] = None,
     ) -> dict:
+        project_scratchpad = _compact_scratchpad(project_scratchpad)
+
         # 1) Infer future goals
         goals_pred = self.future_goal(
             user_profile=user_profile,
@@ -73,9 +97,10 @@ class TaskProposerPipeline(dspy.Module):
             project_scratchpad=project_scratchpad,
             project_description=project_description,
         )
-        future_goals: List[str] = [
-            g.strip() for g in (getattr(goals_pred, "future_goals", []) or []) if g
-        ]
+        # Duplicate goals would each cost an identical milestone LM call.
+        future_goals: List[str] = list(
+            dict.fromkeys(_clean_items(getattr(goals_pred, "future_goals", None)))
+        )
 
         # 2) Induce milestones per goal (batched)
         goal_to_milestones: Dict[str, List[str]] = {}
@@ -95,8 +120,7 @@ class TaskProposerPipeline(dspy.Module):
                 goals_order.append(g)
             ms_out = self.milestone.batch(batch_inputs, disable_progress_bar=True)
             for g, out in zip(goals_order, ms_out):
-                ms_list = [m.strip() for m in (getattr(out, "milestones", []) or []) if m]
-                goal_to_milestones[g] = ms_list
+                goal_to_milestones[g] = _clean_items(getattr(out, "milestones", None))
 
         # 3) Build checklist text from milestones
         important_todo_list = _render_goal_milestones_checklist(goal_to_milestones)
@@ -109,9 +133,7 @@ class TaskProposerPipeline(dspy.Module):
             project_description=project_description,
             important_todo_list=important_todo_list,
         )
-        agent_tasks: List[str] = [
-            t.strip() for t in (getattr(tasks_out, "tasks", []) or []) if t
-        ]
+        agent_tasks: List[str] = _clean_items(getattr(tasks_out, "tasks", None))
 
         # 5) Score proposed tasks (batched, relative)
         assessments: List[TaskAssessment] = []
@@ -417,6 +417,11 @@ async def main() -> None:
         default="openai/gpt-5-mini",
         help="Language model identifier to use with dspy (e.g., 'openai/gpt-4o-mini').",
     )
+    parser.add_argument(
+        "--no-lm-cache",
+        action="store_true",
+        help="Bypass dspy's on-disk LM cache (by default, identical prompts replayed in csv mode are served from it).",
+    )
     parser.add_argument(
         "--no-deploy",
         action="store_true",
@@ -435,8 +440,16 @@ async def main() -> None:
     )
 
     # configure DSPy LM
-    dspy.configure(lm=dspy.LM(args.lm, api_key=os.getenv("OPENAI_API_KEY"), temperature=1.0, max_tokens=24000))
-    logger.info("configured dspy LM: %s", args.lm)
+    dspy.configure(
+        lm=dspy.LM(
+            args.lm,
+            api_key=os.getenv("OPENAI_API_KEY"),
+            temperature=1.0,
+            max_tokens=24000,
+            cache=not args.no_lm_cache,
+        )
+    )
+    logger.info("configured dspy LM: %s (cache=%s)", args.lm, not args.no_lm_cache)
     
     # decide scratchpad path
     db_path = _resolve_scratchpad_db_path(args.mode)
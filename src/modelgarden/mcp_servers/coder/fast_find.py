@@ -20,7 +20,7 @@ import subprocess
 import time
 from pathlib import Path
 from typing import Iterable, Optional, List
-from concurrent.futures import ProcessPoolExecutor, TimeoutError as FUTimeout
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FUTimeout
 
 # -------- Config --------
 PRUNE_DIR_NAMES = {".git", ".svn", ".hg", ".venv", "node_modules", "__pycache__", "Library"}
@@ -57,12 +57,7 @@ def _is_git_repo(path: Path) -> bool:
         return False
 
 def _dedup_keep_order(items: Iterable[str]) -> list[str]:
-    seen, out = set(), []
-    for it in items:
-        if it not in seen:
-            seen.add(it)
-            out.append(it)
-    return out
+    return list(dict.fromkeys(items))
 
 # -------- Backends (subprocess) --------
 def _spotlight_search(name: str, root: Optional[str], timeout: float) -> list[str]:
@@ -290,6 +285,91 @@ def find_folders(
 
     return []
 
+def _ere_escape(name: str) -> str:
+    """Escape a literal folder name for POSIX ERE / Rust regex alternations."""
+    return "".join("\\" + c if c in ".[]()*+?{}|^$\\" else c for c in name)
+
+def _batch_index_search(names: list[str], root: Optional[str], timeout: float) -> list[str]:
+    """One indexed-backend query (spotlight/locate/fd) matching any of `names`."""
+    system = platform.system()
+    if system == "Darwin" and _which("mdfind"):
+        any_name = " || ".join(f'kMDItemFSName == "{n}"' for n in names)
+        return _run(["mdfind", f'({any_name}) && kMDItemContentTypeTree == "public.folder"'], timeout=timeout)
+    alternation = "(" + "|".join(_ere_escape(n) for n in names) + ")"
+    if system == "Linux":
+        locate = _which("plocate") or _which("locate")
+        if locate:
+            return _run([locate, "--regex", f"/{alternation}$"], timeout=timeout)
+    if _which("fd"):
+        root_path = str(Path(root).expanduser().resolve()) if root else (
+            "/" if system != "Windows" else "C:\\"
+        )
+        return _run(["fd", "-t", "d", "-H", "-a", f"^{alternation}$", root_path], timeout=timeout)
+    return []
+
+def find_folders_many(
+    names: Iterable[str],
+    root: Optional[str] = None,
+    require_git: bool = False,
+    max_results: int = 25,
+    timeout: Optional[float] = None,
+    backend_timeout: float = 5.0,
+    allow_slow_python_fallback: bool = True,
+) -> dict[str, list[Path]]:
+    """
+    Batched `find_folders`: returns {name: [paths]} for every name.
+
+    - All names go to a single indexed-backend query (one process spawn instead
+      of one per name); hits are bucketed by exact folder name.
+    - Names the batch query did not find fall back to individual
+      `find_folders` calls, run concurrently within the remaining global `timeout`.
+    - `max_results` applies per name.
+    """
+    names = _dedup_keep_order(n for n in names if n)
+    out: dict[str, list[str]] = {n: [] for n in names}
+    if not names:
+        return {}
+    deadline = time.time() + timeout if timeout else None
+
+    for line in _dedup_keep_order(_batch_index_search(names, root, backend_timeout)):
+        bucket = out.get(os.path.basename(line.rstrip("/\\")))
+        if bucket is None or 0 < max_results <= len(bucket):
+            continue
+        p = Path(line)
+        try:
+            if not p.is_dir() or (require_git and not _is_git_repo(p)):
+                continue
+        except Exception:
+            continue
+        bucket.append(line)
+
+    misses = [n for n in names if not out[n]]
+    if misses:
+        remain = None
+        if deadline:
+            remain = deadline - time.time()
+        if remain is None or remain > 0:
+            def _one(n: str) -> list[str]:
+                try:
+                    return [str(p) for p in find_folders(
+                        n,
+                        root=root,
+                        require_git=require_git,
+                        max_results=max_results,
+                        timeout=remain,
+                        backend_timeout=backend_timeout,
+                        allow_slow_python_fallback=allow_slow_python_fallback,
+                    )]
+                except Exception:
+                    return []
+
+            # Searched concurrently so every miss gets the full remaining budget.
+            with ThreadPoolExecutor(max_workers=min(len(misses), 8)) as ex:
+                for n, hits in zip(misses, ex.map(_one, misses)):
+                    out[n] = hits
+
+    return {n: [Path(h) for h in hits] for n, hits in out.items()}
+
 # -------- CLI --------
 def _cli() -> None:
     ap = argparse.ArgumentParser(description="Fast cross-platform folder finder with hard timeouts.")
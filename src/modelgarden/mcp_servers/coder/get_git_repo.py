@@ -1,10 +1,13 @@
 from git import Repo
 import re
 
+# owner/repo from SSH (git@github.com:owner/repo.git) or HTTPS remote URLs
+_REMOTE_RE = re.compile(r'[:/]([^/]+)/([^/]+?)(?:\.git)?$')
+
 def get_repo_full_name(path: str):
     repo = Repo(path, search_parent_directories=True)
     remote_url = repo.remotes.origin.url  # e.g. git@github.com:XenonMolecule/autometrics-site.git
-    match = re.search(r'[:/]([^/]+)/([^/]+?)(?:\.git)?$', remote_url)
+    match = _REMOTE_RE.search(remote_url)
     if match:
         owner, repo_name = match.groups()
         return f"{owner}/{repo_name}"
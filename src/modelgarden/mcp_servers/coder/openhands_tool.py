@@ -1,21 +1,59 @@
 # openhands_tool.py
 import os
+import re
+import logging
+import mmap
 import asyncio
-import json
 import hashlib
 import argparse
+import copy
+import threading
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any, Tuple
+from typing import Optional, Tuple
 
-from platformdirs import user_data_dir
-from openhands.events.action import MessageAction
-from openhands.core.main import run_controller, auto_continue_response
-from openhands.core.config import setup_config_from_args
+# platformdirs and openhands are imported lazily: openhands pulls in LLM
+# clients and docker/runtime code that link-extraction helpers don't need.
+
+logger = logging.getLogger("modelgarden.coder")
 
 # ------------------------
 # Helpers
 # ------------------------
 
+# Numbered PR and create-PR links in one alternation, so the trajectory is
+# scanned once. Owner/repo segments stop at whitespace, quotes and
+# backslashes so matches never run into surrounding JSON syntax or escapes.
+_PR_LINK_RE = re.compile(
+    rb"https://github\.com/[^/\s\"'\\]+/[^/\s\"'\\]+/pull/"
+    rb"(?:(?P<new>new/[A-Za-z0-9._\-/]+)|(?P<num>\d+))"
+)
+
+# Trailing bytes of a trajectory searched before falling back to the whole file
+_TRAJ_TAIL_WINDOW_BYTES = 1 << 20
+
+
+@lru_cache(maxsize=256)
+def _traj_hash(task: str) -> str:
+    """10-hex-char filename hash of a task; BLAKE2b is faster than SHA-256 and strength is irrelevant here."""
+    return hashlib.blake2b(task.encode("utf-8"), digest_size=5).hexdigest()
+
+
+@lru_cache(maxsize=16)
+def _base_data_dir(appauthor: Optional[str]) -> Path:
+    from platformdirs import user_data_dir
+    return Path(user_data_dir(appname="precursor", appauthor=appauthor, version=None))
+
+
+@lru_cache(maxsize=256)
+def _traj_dir(project_name: str, appauthor: Optional[str]) -> Path:
+    """Per-project trajectory dir, created on first use only (once per process)."""
+    traj_dir = _base_data_dir(appauthor) / project_name / "trajectories"
+    traj_dir.mkdir(parents=True, exist_ok=True)
+    return traj_dir
+
+
 def _make_traj_path(
     project_name: str,
     task: str,
@@ -24,14 +62,20 @@ def _make_traj_path(
 ) -> Path:
     """Compute a trajectory path under a platform-appropriate user dir.
     Filename includes a short hash of the task description for uniqueness."""
-    base_dir = Path(user_data_dir(appname="precursor", appauthor=appauthor, version=None))
-    proj_dir = base_dir / project_name
-    traj_dir = proj_dir / "trajectories"
-    traj_dir.mkdir(parents=True, exist_ok=True)
-    h = hashlib.sha256(task.encode("utf-8")).hexdigest()[:10]
+    traj_dir = _traj_dir(project_name, appauthor)
+    h = _traj_hash(task)
     return traj_dir / f"traj_{h}.json"
 
 
+# Fields that never vary per task. Mirrors add_common_arguments +
+# add_headless_specific_arguments; per-task fields are filled in by copy.
+_BASE_HEADLESS_ARGS = argparse.Namespace(
+    file=None,               # -f/--file not used
+    version=False,
+    agent_cls=None,          # or set your default agent class name
+)
+
+
 def _build_headless_args(
     *,
     task: str,
@@ -47,81 +91,256 @@ def _build_headless_args(
     no_auto_continue: bool = False,
 ) -> argparse.Namespace:
     """Construct a Namespace compatible with setup_config_from_args **without** parse_arguments()."""
-    # Mirrors add_common_arguments + add_headless_specific_arguments
-    return argparse.Namespace(
+    args = copy.copy(_BASE_HEADLESS_ARGS)
+    vars(args).update(
         # common
         config_file=config_file,
         task=task,
-        file=None,               # -f/--file not used
         name=name,
         log_level=log_level,
         llm_config=llm_config,
         agent_config=agent_config,
-        version=False,
         # headless-specific
         directory=directory,
-        agent_cls=None,          # or set your default agent class name
         max_iterations=max_iterations,
         max_budget_per_task=max_budget_per_task,
         no_auto_continue=no_auto_continue,
         selected_repo=selected_repo,
         # NOTE: do NOT add save_trajectory here; not parsed by args
     )
+    return args
 
 
-def _extract_pr_links_from_json(obj: Any) -> Tuple[Optional[str], Optional[str]]:
+def _extract_pr_links_from_bytes(data: bytes | mmap.mmap, pos: int = 0) -> Tuple[Optional[str], Optional[str]]:
     """
-    Recursively search a JSON-like object for GitHub PR links.
+    Search raw trajectory bytes (from offset `pos`) for GitHub PR links.
+
+    The trajectory is only searched, never interpreted, so a single regex pass
+    over the file contents replaces parsing the JSON and walking every node;
+    the pass stops once one link of each kind has been seen.
 
     Returns:
         (pr_url, pr_create_url)
         - pr_url:        https://github.com/<owner>/<repo>/pull/<number>
         - pr_create_url: https://github.com/<owner>/<repo>/pull/new/<ref>
     """
-    import re
-    PR_NUMBER_RE = re.compile(r"https://github\.com/[^/\s]+/[^/\s]+/pull/\d+")
-    PR_CREATE_RE = re.compile(r"https://github\.com/[^/\s]+/[^/\s]+/pull/new/[A-Za-z0-9._\-/]+")
-
-    def scan_text(s: str) -> Tuple[Optional[str], Optional[str]]:
-        a = PR_NUMBER_RE.search(s)
-        b = PR_CREATE_RE.search(s)
-        return (a.group(0) if a else None, b.group(0) if b else None)
-
-    if isinstance(obj, str):
-        return scan_text(obj)
-
     pr_url: Optional[str] = None
     pr_create_url: Optional[str] = None
-
-    if isinstance(obj, dict):
-        iterator = obj.values()
-    elif isinstance(obj, list):
-        iterator = obj
-    else:
-        iterator = []
-
-    for v in iterator:
-        a, b = _extract_pr_links_from_json(v)
-        pr_url = pr_url or a
-        pr_create_url = pr_create_url or b
+    for m in _PR_LINK_RE.finditer(data, pos):
+        if m.group("num") is not None:
+            pr_url = pr_url or m.group(0).decode("utf-8")
+        else:
+            pr_create_url = pr_create_url or m.group(0).decode("utf-8")
         if pr_url and pr_create_url:
             break
-
     return pr_url, pr_create_url
 
 
+def _scan_trajectory_for_pr_links(traj_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Memory-map the trajectory file and search it for PR links without copying it onto the heap.
+
+    The PR is created at the end of a run, so the tail window is searched
+    first; the full file is only scanned for links the tail did not contain."""
+    with open(traj_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None, None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pr_url: Optional[str] = None
+            pr_create_url: Optional[str] = None
+            if size > _TRAJ_TAIL_WINDOW_BYTES:
+                pr_url, pr_create_url = _extract_pr_links_from_bytes(mm, size - _TRAJ_TAIL_WINDOW_BYTES)
+                if pr_url and pr_create_url:
+                    return pr_url, pr_create_url
+            a, b = _extract_pr_links_from_bytes(mm)
+            return pr_url or a, pr_create_url or b
+
+
+_GIT_IDENTITY_SET = False
+
+
 def _ensure_git_identity():
-    """Helpful defaults so git commits/PRs don't fail due to missing identity."""
+    """Helpful defaults so git commits/PRs don't fail due to missing identity (once per process)."""
+    global _GIT_IDENTITY_SET
+    if _GIT_IDENTITY_SET:
+        return
     os.environ.setdefault("GIT_AUTHOR_NAME", "OpenHands Agent")
     os.environ.setdefault("GIT_AUTHOR_EMAIL", "agent@example.com")
     os.environ.setdefault("GIT_COMMITTER_NAME", "OpenHands Agent")
     os.environ.setdefault("GIT_COMMITTER_EMAIL", "agent@example.com")
+    _GIT_IDENTITY_SET = True
+
+
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Lazily start one daemon thread running an event loop for sync-in-async callers."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="openhands-bg-loop", daemon=True).start()
+            _bg_loop = loop
+    return _bg_loop
+
+
+class _RunnerHolder:
+    """Per-thread box for a Runner; the Runner is closed when the box is collected."""
+
+    __slots__ = ("runner", "__weakref__")
+
+    def __init__(self) -> None:
+        self.runner = asyncio.Runner()
+        # Fires when the owning thread exits (threading.local drops the holder)
+        # or at interpreter exit, whichever comes first.
+        weakref.finalize(self, self.runner.close)
+
+
+_runner_local = threading.local()
+
+
+def _get_runner() -> asyncio.Runner:
+    """Per-thread Runner for the sync wrapper, so sync callers on different
+    threads run concurrently; each is closed when its thread goes away."""
+    holder = getattr(_runner_local, "holder", None)
+    if holder is None:
+        holder = _runner_local.holder = _RunnerHolder()
+    return holder.runner
 
 
 # ------------------------
 # Public API
 # ------------------------
 
+@lru_cache(maxsize=1)
+def load_openhands():
+    """Import the OpenHands entry points (slow, once per process).
+
+    Returns (MessageAction, run_controller, auto_continue_response, setup_config_from_args).
+    Callers may invoke this ahead of time, e.g. in a worker thread, to warm the import.
+    """
+    from openhands.events.action import MessageAction
+    from openhands.core.main import run_controller, auto_continue_response
+    from openhands.core.config import setup_config_from_args
+    return MessageAction, run_controller, auto_continue_response, setup_config_from_args
+
+
+class OpenHandsSession:
+    """Reusable OpenHands setup for several tasks against one repository.
+
+    Loads OpenHands, applies the git identity / token, and builds the
+    OpenHands config once; each `run()` gets a copy of that config with its
+    own trajectory path. The sandbox runtime itself is still started per task
+    by `run_controller`.
+    """
+
+    def __init__(
+        self,
+        *,
+        project_name: str,
+        repo: str,
+        github_token: Optional[str] = None,
+        auto_continue: bool = True,
+        appauthor: Optional[str] = None,
+        name: str = "",
+        config_file: str = "config.toml",
+        log_level: Optional[str] = None,
+        llm_config: Optional[str] = None,
+        agent_config: Optional[str] = None,
+        directory: Optional[str] = None,
+        max_iterations: Optional[int] = None,
+        max_budget_per_task: Optional[float] = None,
+    ) -> None:
+        _, _, _, setup_config_from_args = load_openhands()
+
+        if github_token and os.environ.get("GITHUB_TOKEN") != github_token:
+            os.environ["GITHUB_TOKEN"] = github_token
+
+        _ensure_git_identity()
+
+        self.project_name = project_name
+        self.repo = repo
+        self.auto_continue = auto_continue
+        self.appauthor = appauthor
+
+        # setup_config_from_args does not read `task`; it is passed per run
+        # as the initial MessageAction instead.
+        args = _build_headless_args(
+            task="",
+            selected_repo=repo,
+            config_file=config_file,
+            name=name,
+            log_level=log_level or os.getenv("OPENHANDS_LOG_LEVEL", None),
+            llm_config=llm_config,
+            agent_config=agent_config,
+            directory=directory,
+            max_iterations=max_iterations,
+            max_budget_per_task=max_budget_per_task,
+            no_auto_continue=not auto_continue,
+        )
+
+        # Turn Namespace -> OpenHands config object
+        self._config = setup_config_from_args(args)
+
+        # Defensive: ensure the repo is set on the sandbox
+        if getattr(self._config, "sandbox", None):
+            self._config.sandbox.selected_repo = repo
+
+    async def run(self, task: str) -> dict:
+        """Run one task and try to extract a PR URL from its trajectory.
+
+        Returns:
+            {
+              "sid": str | None,
+              "final_state": str | None,
+              "pr_url": str | None,
+              "pr_create_url": str | None,
+              "trajectory_path": str
+            }
+        """
+        MessageAction, run_controller, auto_continue_response, _ = load_openhands()
+
+        traj_path = _make_traj_path(self.project_name, task, appauthor=self.appauthor)
+
+        # Per-task copy so concurrent runs don't share the trajectory path
+        config = copy.deepcopy(self._config)
+
+        # Wire the exact field the main loop checks:
+        config.save_trajectory_path = str(traj_path)
+
+        # Kick off the task
+        state = await run_controller(
+            config=config,
+            initial_user_action=MessageAction(content=task),
+            fake_user_response_fn=auto_continue_response if self.auto_continue else None,
+        )
+
+        result = {
+            "sid": getattr(state, "sid", None),
+            "final_state": state.agent_state.name if state else None,
+            "pr_url": None,
+            "pr_create_url": None,
+            "trajectory_path": str(traj_path),
+        }
+
+        # Parse trajectory for PR links (numbered + create-PR)
+        try:
+            # Off the event loop: trajectories can be tens of MB
+            pr_url, pr_create_url = await asyncio.to_thread(_scan_trajectory_for_pr_links, traj_path)
+            result["pr_url"] = pr_url or pr_create_url  # prefer numbered, fallback to create-PR link
+            result["pr_create_url"] = pr_create_url
+        except FileNotFoundError:
+            # Leave pr_url as None; caller can inspect logs/agent state
+            logger.warning("trajectory not written: %s", traj_path)
+        except (OSError, ValueError) as e:
+            # ValueError: mmap of a file truncated between stat and map
+            logger.warning("could not scan trajectory %s for PR links: %s", traj_path, e)
+
+        return result
+
+
 async def run_openhands_task_with_pr_async(
     *,
     project_name: str,
@@ -141,6 +360,9 @@ async def run_openhands_task_with_pr_async(
 ) -> dict:
     """Run OpenHands headlessly against a repo and try to extract a PR URL from its trajectory.
 
+    One-off convenience around a transient `OpenHandsSession`; use a session
+    directly to submit several tasks for the same repository.
+
     Returns:
         {
           "sid": str | None,
@@ -150,67 +372,22 @@ async def run_openhands_task_with_pr_async(
           "trajectory_path": str
         }
     """
-    if github_token:
-        os.environ["GITHUB_TOKEN"] = github_token
-
-    _ensure_git_identity()
-
-    traj_path = _make_traj_path(project_name, task, appauthor=appauthor)
-
-    args = _build_headless_args(
-        task=task,
-        selected_repo=repo,
-        config_file=config_file,
+    session = OpenHandsSession(
+        project_name=project_name,
+        repo=repo,
+        github_token=github_token,
+        auto_continue=auto_continue,
+        appauthor=appauthor,
         name=name,
-        log_level=log_level or os.getenv("OPENHANDS_LOG_LEVEL", None),
+        config_file=config_file,
+        log_level=log_level,
         llm_config=llm_config,
         agent_config=agent_config,
         directory=directory,
         max_iterations=max_iterations,
         max_budget_per_task=max_budget_per_task,
-        no_auto_continue=not auto_continue,
-    )
-
-    # Turn Namespace -> OpenHands config object
-    config = setup_config_from_args(args)
-
-    # Wire the exact field the main loop checks:
-    config.save_trajectory_path = str(traj_path)
-
-    # Defensive: ensure the repo is set on the sandbox
-    if getattr(config, "sandbox", None):
-        config.sandbox.selected_repo = repo
-
-    # Kick off the task
-    state = await run_controller(
-        config=config,
-        initial_user_action=MessageAction(content=task),
-        fake_user_response_fn=auto_continue_response if auto_continue else None,
     )
-
-    result = {
-        "sid": getattr(state, "sid", None),
-        "final_state": state.agent_state.name if state else None,
-        "pr_url": None,
-        "pr_create_url": None,
-        "trajectory_path": str(traj_path),
-    }
-
-    # Parse trajectory for PR links (numbered + create-PR)
-    try:
-        with open(traj_path, "r", encoding="utf-8") as f:
-            hist = json.load(f)
-        pr_url, pr_create_url = _extract_pr_links_from_json(hist)
-        result["pr_url"] = pr_url or pr_create_url  # prefer numbered, fallback to create-PR link
-        result["pr_create_url"] = pr_create_url
-    except FileNotFoundError:
-        # Leave pr_url as None; caller can inspect logs/agent state
-        pass
-    except Exception:
-        # Keep silent here; add logging if desired
-        pass
-
-    return result
+    return await session.run(task)
 
 
 def run_openhands_task_with_pr(
@@ -225,27 +402,24 @@ def run_openhands_task_with_pr(
 ) -> dict:
     """Synchronous convenience wrapper.
 
-    IMPORTANT: This **must not** be called from within a running event loop.
-    Prefer the async version in async code paths.
+    Without a running event loop this runs on the calling thread's ``asyncio.Runner``. Called from inside
+    a running loop (legacy sync code in an async context), the coroutine is
+    submitted to a long-lived background loop thread and this call blocks
+    until it finishes. Prefer the async version in async code paths.
     """
+    coro = run_openhands_task_with_pr_async(
+        project_name=project_name,
+        repo=repo,
+        task=task,
+        github_token=github_token,
+        auto_continue=auto_continue,
+        appauthor=appauthor,
+        **kwargs,
+    )
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        # No loop running: safe to create one.
-        return asyncio.run(
-            run_openhands_task_with_pr_async(
-                project_name=project_name,
-                repo=repo,
-                task=task,
-                github_token=github_token,
-                auto_continue=auto_continue,
-                appauthor=appauthor,
-                **kwargs,
-            )
-        )
-    else:
-        # A loop is already running; require the async API.
-        raise RuntimeError(
-            "run_openhands_task_with_pr() called inside an active event loop. "
-            "Use 'await run_openhands_task_with_pr_async(...)' instead."
-        )
\ No newline at end of file
+        # No loop running: reuse this thread's Runner so the loop (and HTTP
+        # client pools bound to it) survive across back-to-back sync calls.
+        return _get_runner().run(coro)
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
@@ -13,33 +13,93 @@ Keep docstrings exactly as authored; DSPy/tool callers rely on them.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
 import json
 import platform
+import re
 import subprocess
+import tempfile
+import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from mcp.server.fastmcp import FastMCP
-from dotenv import load_dotenv
-load_dotenv()
+from platformdirs import user_data_dir
 
 # Match your original import structure (you said these are available):
-from precursor.mcp_servers.coder.fast_find import find_folders
+from precursor.mcp_servers.coder.fast_find import find_folders_many
 from precursor.mcp_servers.coder.get_git_repo import get_repo_full_name
 
 # Scratchpad rendering + artifact logging (your existing modules)
 from precursor.scratchpad import render as scratchpad_render
 from precursor.core_tools.artifacts import store_artifact
 
-# OpenHands runner colocated with this server package per your note
-from precursor.mcp_servers.coder.openhands_tool import run_openhands_task_with_pr_async
+# orjson parses large trajectories several times faster than stdlib json;
+# ujson is the next-best drop-in. Both are optional, so fall back to json.
+try:
+    import orjson
+
+    def _json_loads(raw: bytes | str) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and lone surrogate escapes that
+            # stdlib json accepts; retry rather than give up on the trajectory
+            return json.loads(raw)
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates that only stdlib json could parse
+            return json.dumps(obj, ensure_ascii=False)
+except ImportError:
+    try:
+        import ujson
+
+        def _json_loads(raw: bytes | str) -> Any:
+            text = _as_text(raw)
+            try:
+                return ujson.loads(text)
+            except ValueError:
+                # Same leniency gap as orjson: let stdlib json have a go
+                return json.loads(text)
+
+        def _json_dumps(obj: Any) -> str:
+            try:
+                # Unescaped slashes keep URLs identical to the json/orjson output
+                return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+            except (ValueError, OverflowError):
+                return json.dumps(obj, ensure_ascii=False)
+    except ImportError:
+        def _json_loads(raw: bytes | str) -> Any:
+            return json.loads(raw)
+
+        def _json_dumps(obj: Any) -> str:
+            return json.dumps(obj, ensure_ascii=False)
+
+
+def _as_text(raw: bytes | str) -> str:
+    return raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+
+
+# OpenHands runner colocated with this server package per your note. The
+# module itself is light; the heavy openhands imports happen in
+# load_openhands(), which CodeAgent.run overlaps with repository resolution.
+from precursor.mcp_servers.coder.openhands_tool import load_openhands, run_openhands_task_with_pr_async
 
 # dspy + your minimal agent scaffolding (kept as in your old file)
 import dspy
 
 
 mcp = FastMCP("coder")
+logger = logging.getLogger("modelgarden.coder")
 
 
 # ---------------------------------------------------------------------------
@@ -127,47 +187,293 @@ def ensure_docker_running(timeout_seconds: int = 180) -> bool:
 # DSPy agent code (unchanged except: project_context now comes from scratchpad)
 # ---------------------------------------------------------------------------
 
+# Input fields are ordered stable -> volatile (project before task / search
+# results) so the serialized prompt shares a long common prefix across tasks
+# on the same project, which providers can serve from their prompt cache.
 class IdentifyRepositoryName(dspy.Signature):
     """Identify the possible name of the repository that we are working on.  Take in the project context and return a list of possible repository names.  If the project context contains a repository name, return that first."""
     project_name: str = dspy.InputField(description="The name of the project that we are working on")
-    task_context: str = dspy.InputField(description="Detailed context about the task that we are working on.")
     project_context: str = dspy.InputField(description="Detailed context about the project that we are working on.  The Files section may contain repository names.")
+    task_context: str = dspy.InputField(description="Detailed context about the task that we are working on.")
     potential_repository_names: list[str] = dspy.OutputField(description="A list of possible repository names.  Only return repository names that are likely to be the repository that we are working on.  If the repo name seems like a guess or has spaces you should suggest variations of the name to help identify the true repository name as a folder name (the true repo name is unlikely to have spaces).  Variations may include removing spaces, adding hyphens, adding underscores, lowercasing, etc.")
 
 
 class SelectRepositoryName(dspy.Signature):
     """Select the repository name that we are working on. Given a list of actual files and folders on the local machine, select the single path that is most likely to be the repository that we are working on.  Note that if you find subfiles of the repository name, you should select the parent folder of the subfiles as the repository path."""
     project_name: str = dspy.InputField(description="The name of the project that we are working on")
-    task_context: str = dspy.InputField(description="Detailed context about the task that we are working on.")
     project_context: str = dspy.InputField(description="Detailed context about the project that we are working on.  The Files section may contain repository names.")
+    task_context: str = dspy.InputField(description="Detailed context about the task that we are working on.")
     actual_files_and_folders: list[str] = dspy.InputField(description="A list of actual files and folders on the local machine.")
     repository_path: str = dspy.OutputField(description="The single path that is most likely to be the repository that we are working on.  Should be a global path to the repository on the local machine.  If you have low confidence in the repository path, return None.")
 
 
+# ---------------------------------------------------------------------------
+# Repository-path cache (JSON file under the user data dir)
+# ---------------------------------------------------------------------------
+REPO_CACHE_TTL_SECONDS = 7 * 86400
+
+
+def _repo_cache_path() -> Path:
+    return Path(user_data_dir(appname="precursor")) / "repo_cache.json"
+
+
+def _repo_cache_key(project_name: str, project_context: str) -> str:
+    # Key on the resources slice only: the rest of the scratchpad changes between
+    # events (and after every task), which would make the key miss every time.
+    material = project_name + "\x00" + _repo_context(project_context)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _load_repo_cache() -> Dict[str, Any]:
+    try:
+        with open(_repo_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_repo_cache(cache: Dict[str, Any]) -> None:
+    path = _repo_cache_path()
+    now = time.time()
+    # Drop expired entries so the file stays small; keys rarely repeat exactly
+    live = {
+        k: v for k, v in cache.items()
+        if isinstance(v, dict)
+        and isinstance(v.get("ts"), (int, float))
+        and now - v["ts"] < REPO_CACHE_TTL_SECONDS
+    }
+    tmp_name: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer: concurrent resolutions run in worker threads
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=".repo_cache.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_name = f.name
+            json.dump(live, f)
+        os.replace(tmp_name, path)
+    except OSError:
+        # Cache is an optimization only; never fail the task over it
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _get_cached_repository_path(project_name: str, project_context: str) -> Optional[str]:
+    """Return a previously resolved repository path if it is fresh and still on disk."""
+    cache = _load_repo_cache()
+    key = _repo_cache_key(project_name, project_context)
+    entry = cache.get(key)
+    if not isinstance(entry, dict):
+        return None
+    path = entry.get("path")
+    ts = entry.get("ts")
+    # Malformed entries count as misses, same as in _save_repo_cache
+    fresh = isinstance(ts, (int, float)) and time.time() - ts < REPO_CACHE_TTL_SECONDS
+    if fresh and isinstance(path, str) and path and Path(path).is_dir():
+        return path
+    # Stale or moved: drop it so the next lookup resolves from scratch
+    cache.pop(key, None)
+    _save_repo_cache(cache)
+    return None
+
+
+def _cache_repository_path(project_name: str, project_context: str, repository_path: Optional[str]) -> None:
+    """Remember a resolved repository path (only if it exists on disk)."""
+    if not repository_path or not Path(repository_path).is_dir():
+        return
+    cache = _load_repo_cache()
+    cache[_repo_cache_key(project_name, project_context)] = {"path": repository_path, "ts": time.time()}
+    _save_repo_cache(cache)
+
+
+def _invalidate_repository_path(project_name: str, project_context: str) -> None:
+    cache = _load_repo_cache()
+    if cache.pop(_repo_cache_key(project_name, project_context), None) is not None:
+        _save_repo_cache(cache)
+
+
+# Upper bound on search hits handed to SelectRepositoryName (keeps the prompt small)
+MAX_REPOSITORY_CANDIDATES = 20
+
+
+def _dedupe_names(names: list[str]) -> list[str]:
+    """
+    Drop blank and duplicate candidate names, keeping first-seen order. The
+    comparison is exact: every search backend matches folder names
+    case-sensitively, so "MyRepo" and "myrepo" are different searches.
+    """
+    return list(dict.fromkeys(c for c in (str(n).strip() for n in names or []) if c))
+
+
+def _dedupe_paths(paths) -> list[str]:
+    """Drop paths that resolve to the same absolute location, keeping first-seen order."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for p in paths:
+        try:
+            key = str(Path(p).resolve())
+        except OSError:
+            key = p
+        if key not in seen:
+            seen.add(key)
+            out.append(p)
+    return out
+
+
+_URI_RE = re.compile(r"\(uri:\s*([^)]+?)\)")
+
+
+def _git_root(path: Path) -> Optional[Path]:
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def _repository_from_context_uris(project_context: str) -> Optional[str]:
+    """
+    Return the git root shared by the local `(uri: ...)` paths in the project
+    context, or None when there are none or they point at different repos.
+    """
+    roots: set[Path] = set()
+    for uri in _URI_RE.findall(project_context or ""):
+        uri = uri.strip()
+        if uri.startswith("file://"):
+            uri = uri[len("file://"):]
+        elif "://" in uri:
+            continue  # remote resource (https, gdrive, ...)
+        path = Path(uri).expanduser()
+        if not path.is_absolute():
+            continue  # no reliable base to resolve relative paths against
+        try:
+            if not path.exists():
+                continue
+            root = _git_root(path if path.is_dir() else path.parent)
+        except OSError:
+            continue
+        if root is not None:
+            roots.add(root)
+    if len(roots) == 1:
+        return str(roots.pop())
+    return None
+
+
+_RESOURCES_HEADING_RE = re.compile(r"^(#{1,6})[ \t]*(?:Project Resources|Files)\b.*$", re.M | re.I)
+# Fallback prefix length when the context has no resources section
+_MAX_REPO_CONTEXT_CHARS = 1024
+
+
+def _repo_context(project_context: str) -> str:
+    """
+    Slice the rendered scratchpad down to its resources (Files/Repos/Folders)
+    section, the only part that helps name the repository. Falls back to a
+    short prefix when no such heading exists.
+    """
+    ctx = project_context or ""
+    m = _RESOURCES_HEADING_RE.search(ctx)
+    if not m:
+        return ctx[:_MAX_REPO_CONTEXT_CHARS]
+    # Section ends at the next heading of the same or a higher level
+    end = re.compile(rf"^#{{1,{len(m.group(1))}}}[ \t]", re.M).search(ctx, m.end())
+    return ctx[m.start():end.start() if end else len(ctx)].strip()
+
+
+def _project_name_variants(project_name: str) -> list[str]:
+    """Folder-name spellings of the project name that are worth searching without asking the LLM."""
+    name = (project_name or "").strip()
+    if not name:
+        return []
+    spellings = []
+    for base in (name, name.lower()):
+        spellings += [base, base.replace(" ", "-"), base.replace(" ", "_"), base.replace(" ", "")]
+    return _dedupe_names(spellings)
+
+
+def _search_folder_hits(names: list[str]) -> Dict[str, list[str]]:
+    """
+    Batched folder search keyed by the exact name searched. Only one path is selected
+    in the end, so two hits per name are plenty. A failed search contributes nothing.
+    """
+    if not names:
+        return {}
+    try:
+        found = find_folders_many(names, max_results=2, timeout=5, backend_timeout=5)
+    except Exception:
+        return {}
+    return {name: [str(p) for p in hits] for name, hits in found.items()}
+
+
 class FindRepository(dspy.Module):
     def __init__(self):
         self.identify_repository_name = dspy.ChainOfThought(IdentifyRepositoryName)
         self.select_repository_name = dspy.ChainOfThought(SelectRepositoryName)
 
-    def forward(self, project_name: str, project_context: str, task_context: str) -> str:
-        potential_repository_names = self.identify_repository_name(
-            project_name=project_name,
-            task_context=task_context,
-            project_context=project_context
-        ).potential_repository_names
+    def forward(self, project_name: str, project_context: str, task_context: str) -> Optional[str]:
+        """
+        Resolve the local repository path for the project.
 
-        actual_files_and_folders: list[str] = []
-        for potential_repository_name in potential_repository_names:
-            # Use your existing fast_find helper exactly as before
-            hits = find_folders(potential_repository_name, max_results=5, timeout=5, backend_timeout=5)
-            actual_files_and_folders.extend([str(p) for p in hits])
+        Assumes the rendered scratchpad lists resources as `(uri: <path>)`. If
+        those uris point into exactly one local git repository, that repository
+        is returned without any LLM call; otherwise the names are identified and
+        selected with the two ChainOfThought predictors.
+        """
+        cached = _get_cached_repository_path(project_name, project_context)
+        if cached:
+            return cached
+
+        from_uri = _repository_from_context_uris(project_context)
+        if from_uri:
+            _cache_repository_path(project_name, project_context, from_uri)
+            return from_uri
+
+        # Only the resources section matters for naming the repo; the full
+        # context is still used for the cache key and downstream by OpenHands.
+        repo_context = _repo_context(project_context)
+
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            # Variants of the project name do not depend on the LLM, so search
+            # for them while IdentifyRepositoryName is still in flight.
+            speculative_names = _project_name_variants(project_name)
+            speculative = ex.submit(_search_folder_hits, speculative_names)
+
+            potential_repository_names = _dedupe_names(self.identify_repository_name(
+                project_name=project_name,
+                task_context=task_context,
+                project_context=repo_context
+            ).potential_repository_names)
+
+            known = set(speculative_names)
+            novel = [n for n in potential_repository_names if n not in known]
+            searches = _search_folder_hits(novel)
+            searches.update(speculative.result())
+
+        # LLM-proposed names first, then any speculative variants it did not propose
+        order = potential_repository_names + [
+            n for n in speculative_names if n not in potential_repository_names
+        ]
+        hits = [path for key in order for path in searches.get(key, [])]
+
+        actual_files_and_folders = _dedupe_paths(hits)[:MAX_REPOSITORY_CANDIDATES]
+
+        # Nothing to choose between: skip the SelectRepositoryName round-trip
+        if not actual_files_and_folders:
+            return None
+        if len(actual_files_and_folders) == 1:
+            repository_path = actual_files_and_folders[0]
+            _cache_repository_path(project_name, project_context, repository_path)
+            return repository_path
 
         repository_path = self.select_repository_name(
             project_name=project_name,
             task_context=task_context,
-            project_context=project_context,
+            project_context=repo_context,
             actual_files_and_folders=actual_files_and_folders
         ).repository_path
+        _cache_repository_path(project_name, project_context, repository_path)
         return repository_path
 
 
@@ -187,11 +493,50 @@ class SummarizeTrajectory(dspy.Signature):
     full_summary: str = dspy.OutputField(description="A detailed, step-by-step summary of what the agent accomplished.")
 
 
+@lru_cache(maxsize=1)
+def _get_find_repository() -> FindRepository:
+    """Process-wide FindRepository so its predictors are built once, not per agent."""
+    return FindRepository()
+
+
+@lru_cache(maxsize=1)
+def _get_summarizer() -> dspy.ChainOfThought:
+    return dspy.ChainOfThought(SummarizeTrajectory)
+
+
+def _with_prompt_cache(lm: dspy.LM, cache_key: str) -> dspy.LM:
+    """
+    Return a copy of `lm` that asks the provider to route requests sharing
+    `cache_key` to the same prompt cache. Only OpenAI exposes an explicit
+    key; other providers cache identical prefixes automatically.
+    """
+    model_name = str(getattr(lm, "model", "") or "")
+    if not model_name.startswith("openai/"):
+        return lm
+    extra_body = dict(lm.kwargs.get("extra_body") or {})
+    extra_body.setdefault("prompt_cache_key", cache_key)
+    return lm.copy(extra_body=extra_body)
+
+
+# Fixed instructions appended to every OpenHands task. Kept as one constant so
+# the prompt has an identical block across tasks for provider prefix caching.
+_TASK_STEPS = textwrap.dedent("""\
+    Please follow the following steps to complete the task: ===
+    1. Make a branch in the repository called `precursor-<task>` where <task> is a single word identifying the task.
+    2. Check out the branch.
+    3. Investigate the repository to understand the codebase and the task.
+    4. Edit the code in the branch to complete the task.
+    5. Commit the changes to the branch.
+    6. Push the changes to the branch.
+    7. Create a pull request to the repository.  It's fine to point to the url that will create the pull request as the pull request url.  Be clear about what this url is though!
+    You may wish to add more detailed steps to the task as you need for certain more specific tasks.  Be sure to ALWAYS create a branch and a pull request for the task.""")
+
+
 class CodeAgent:
     def __init__(self, model: dspy.LM):
-        self.model = model or dspy.settings.lm
-        self.find_repository = FindRepository()
-        self.summarize = dspy.ChainOfThought(SummarizeTrajectory)
+        self.model = _with_prompt_cache(model or dspy.settings.lm, "precursor::coder")
+        self.find_repository = _get_find_repository()
+        self.summarize = _get_summarizer()
 
     async def run(self, project_name: str, task_context: str) -> Dict[str, Any]:
         """
@@ -201,30 +546,21 @@ class CodeAgent:
         # Render scratchpad to feed repo finder (acts as project_context)
         project_context = scratchpad_render.render_project_scratchpad(project_name)
 
-        with dspy.context(lm=self.model):
-            repository_path = self.find_repository(
-                project_name=project_name,
-                project_context=project_context,
-                task_context=task_context
-            )
-
-        repo_full_name = get_repo_full_name(repository_path)
+        # Repo resolution (LLM + filesystem + git remote) and the slow OpenHands
+        # import are independent, so run them side by side off the event loop.
+        _, (repository_path, repo_full_name) = await asyncio.gather(
+            asyncio.to_thread(load_openhands),
+            asyncio.to_thread(self._resolve_repository, project_name, project_context, task_context),
+        )
 
+        # Stable text first (repo, project context, fixed steps), the task last
         full_task = (
             f"We are working on the {repo_full_name} repository.  "
             f"The broader project is {project_name}. Some broader details about the project are shared below ===\n"
             f"{project_context}\n===\n\n"
+            f"{_TASK_STEPS}\n===\n\n"
             f"HOWEVER I want you to focus only on this specific task: ===\n"
-            f"{task_context}\n===\n\n"
-            f"Please follow the following steps to complete the task: ===\n"
-            f"1. Make a branch in the repository called `precursor-<task> where <task> is a single word identifying the task."
-            f"2. Check out the branch."
-            f"3. Investigate the repository to understand the codebase and the task."
-            f"4. Edit the code in the branch to complete the task."
-            f"5. Commit the changes to the branch."
-            f"6. Push the changes to the branch."
-            f"7. Create a pull request to the repository.  It's fine to point to the url that will create the pull request as the pull request url.  Be clear about what this url is though!"
-            f"You may wish to add more detailed steps to the task as you need for certain more specific tasks.  Be sure to ALWAYS create a branch and a pull request for the task."
+            f"{task_context}\n===\n"
         )
 
         result = await run_openhands_task_with_pr_async(
@@ -239,13 +575,14 @@ class CodeAgent:
         traj_json_str = "{}"
         if traj_path:
             try:
-                with open(traj_path, "r", encoding="utf-8") as f:
-                    raw = f.read()
+                raw = await asyncio.to_thread(Path(traj_path).read_bytes)
                 # Reduce to highlights to avoid context overflow while keeping truthful content
-                traj_json_str = self._shrink_trajectory_json(raw, max_items=40, max_message_chars=2000)
-            except Exception:
+                traj_json_str = await asyncio.to_thread(
+                    self._shrink_trajectory_json, raw, max_items=40, max_message_chars=2000
+                )
+            except OSError as e:
                 # Leave as "{}" if we can't read it
-                pass
+                logger.warning("could not read trajectory %s: %s", traj_path, e)
 
         # Summarize (short + long) with one DSPy call
         with dspy.context(lm=self.model):
@@ -291,8 +628,28 @@ class CodeAgent:
             "artifact_recorded": artifact_recorded,
         }
 
+    def _resolve_repository(self, project_name: str, project_context: str, task_context: str) -> tuple[str, str]:
+        """Return (repository_path, repo_full_name); blocking, meant for a worker thread."""
+        with dspy.context(lm=self.model):
+            repository_path = self.find_repository(
+                project_name=project_name,
+                project_context=project_context,
+                task_context=task_context
+            )
+        if not repository_path:
+            # get_repo_full_name(None) would silently fall back to the cwd's repo
+            raise ValueError(f"Could not locate a local repository for project {project_name!r}")
+
+        try:
+            repo_full_name = get_repo_full_name(repository_path)
+        except Exception:
+            # A cached path may no longer be a usable repo; forget it so the next run re-resolves
+            _invalidate_repository_path(project_name, project_context)
+            raise
+        return repository_path, repo_full_name
+
     @staticmethod
-    def _shrink_trajectory_json(raw: str, *, max_items: int = 40, max_message_chars: int = 2000) -> str:
+    def _shrink_trajectory_json(raw: bytes | str, *, max_items: int = 40, max_message_chars: int = 2000) -> str:
         """
         Create a compact JSON string from the trajectory:
         - Keep only the last `max_items` entries
@@ -301,9 +658,9 @@ class CodeAgent:
         If parsing fails, return the original string.
         """
         try:
-            data = json.loads(raw)
+            data = _json_loads(raw)
             if not isinstance(data, list):
-                return raw
+                return _as_text(raw)
             # Take last N entries
             tail = data[-max_items:]
             compact: list[dict] = []
@@ -319,9 +676,9 @@ class CodeAgent:
                     "source": entry.get("source"),
                     "message": msg,
                 })
-            return json.dumps(compact, ensure_ascii=False)
+            return _json_dumps(compact)
         except Exception:
-            return raw
+            return _as_text(raw)
 
 
 # ---------------------------------------------------------------------------
@@ -401,5 +758,14 @@ async def run_code_task(
     )
 
 
+def _load_env() -> None:
+    """Load `.env` for the standalone server; set PRECURSOR_SKIP_DOTENV=1 to opt out."""
+    if os.getenv("PRECURSOR_SKIP_DOTENV") == "1":
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 if __name__ == "__main__":
+    _load_env()
     mcp.run()
\ No newline at end of file
@@ -22,10 +22,13 @@ Run locally:
 
 from __future__ import annotations
 
+import asyncio
 import io
 import os
 import pickle
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -113,12 +116,32 @@ class DriveTools:
     - No public API exists to create tracked “Suggesting mode” edits. We use
       real insertions plus highlight for a clear, reliable UX.
     - Indices are UTF-16; concurrent edits may shift indices between read & write.
+    - Safe to call from several threads: the underlying httplib2 transport is
+      not thread-safe, so each thread gets its own Drive/Docs service objects.
     """
 
+    # Max number of (file_id, modifiedTime) -> text entries kept in memory
+    TEXT_CACHE_SIZE = 128
+
     def __init__(self, credentials_file: str = "credentials.json", token_file: str = "token.pickle") -> None:
-        creds = _get_credentials(credentials_file, token_file, SCOPES)
-        self.drive = build("drive", "v3", credentials=creds)
-        self.docs = build("docs", "v1", credentials=creds)
+        self._creds = _get_credentials(credentials_file, token_file, SCOPES)
+        self._local = threading.local()
+        self._text_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._text_cache_lock = threading.Lock()
+
+    @property
+    def drive(self):
+        svc = getattr(self._local, "drive", None)
+        if svc is None:
+            svc = self._local.drive = build("drive", "v3", credentials=self._creds)
+        return svc
+
+    @property
+    def docs(self):
+        svc = getattr(self._local, "docs", None)
+        if svc is None:
+            svc = self._local.docs = build("docs", "v1", credentials=self._creds)
+        return svc
 
     # ===== 1) Search =====
     def search_files(self, query: str, page_size: int = 20) -> List[Dict[str, Any]]:
@@ -168,10 +191,26 @@ class DriveTools:
         str
             Plain text contents (best effort). For binaries: a readable placeholder.
         """
-        meta = self.drive.files().get(fileId=file_id, fields="mimeType, size").execute()
+        meta = self.drive.files().get(fileId=file_id, fields="mimeType, size, modifiedTime").execute()
         mime = meta.get("mimeType", "")
-        size = int(meta.get("size", 0)) if meta.get("size") else None
 
+        # Unchanged files (same modifiedTime) are served from memory
+        cache_key = (file_id, meta.get("modifiedTime") or "")
+        with self._text_cache_lock:
+            cached = self._text_cache.get(cache_key)
+            if cached is not None:
+                self._text_cache.move_to_end(cache_key)
+                return cached
+
+        text = self._fetch_as_text(file_id, mime)
+        if cache_key[1]:
+            with self._text_cache_lock:
+                self._text_cache[cache_key] = text
+                if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                    self._text_cache.popitem(last=False)
+        return text
+
+    def _fetch_as_text(self, file_id: str, mime: str) -> str:
         # Google Editors
         if mime == "application/vnd.google-apps.document":
             data = self._export_bytes(file_id, "text/plain")
@@ -396,17 +435,31 @@ class DriveTools:
 
 
 # ========= FastMCP server wiring =========
+# Tools are async and run the blocking Google API calls in worker threads, so
+# independent tool calls from one client proceed concurrently instead of
+# queueing on the server's event loop.
 
 mcp = FastMCP("drive")
 
-# Construct a single DriveTools instance using env-provided paths (or defaults).
-_DRIVE = DriveTools(
-    credentials_file=os.environ.get("GOOGLE_CREDENTIALS_JSON", "credentials.json"),
-    token_file=os.environ.get("GOOGLE_TOKEN_PICKLE", "token.pickle"),
-)
+# A single DriveTools instance per process, built on first tool call using
+# env-provided paths (or defaults) so importing this module never triggers OAuth.
+_DRIVE: Optional[DriveTools] = None
+_DRIVE_LOCK = threading.Lock()
+
+
+def _get_drive() -> DriveTools:
+    global _DRIVE
+    with _DRIVE_LOCK:
+        if _DRIVE is None:
+            _DRIVE = DriveTools(
+                credentials_file=os.environ.get("GOOGLE_CREDENTIALS_JSON", "credentials.json"),
+                token_file=os.environ.get("GOOGLE_TOKEN_PICKLE", "token.pickle"),
+            )
+    return _DRIVE
+
 
 @mcp.tool()
-def search_files(query: str, page_size: int = 20) -> List[Dict[str, Any]]:
+async def search_files(query: str, page_size: int = 20) -> List[Dict[str, Any]]:
     """
     Search for files in the user’s Google Drive.
 
@@ -425,11 +478,11 @@ def search_files(query: str, page_size: int = 20) -> List[Dict[str, Any]]:
     List[Dict[str, Any]]
         Each dict contains: {id, name, mimeType, modifiedTime}.
     """
-    return _DRIVE.search_files(query, page_size)
+    return await asyncio.to_thread(_get_drive().search_files, query, page_size)
 
 
 @mcp.tool()
-def get_file_as_text(file_id: str) -> str:
+async def get_file_as_text(file_id: str) -> str:
     """
     Return the file's contents as **plain text** when possible.
 
@@ -449,11 +502,11 @@ def get_file_as_text(file_id: str) -> str:
     str
         Plain text contents (best effort). For binaries: a readable placeholder.
     """
-    return _DRIVE.get_file_as_text(file_id)
+    return await asyncio.to_thread(_get_drive().get_file_as_text, file_id)
 
 
 @mcp.tool()
-def create_google_doc(name: str, parent_folder_id: Optional[str] = None) -> str:
+async def create_google_doc(name: str, parent_folder_id: Optional[str] = None) -> str:
     """
     Create a new Google Doc and return its Drive file ID.
 
@@ -469,11 +522,11 @@ def create_google_doc(name: str, parent_folder_id: Optional[str] = None) -> str:
     str
         The new file ID (also the Docs documentId).
     """
-    return _DRIVE.create_google_doc(name, parent_folder_id)
+    return await asyncio.to_thread(_get_drive().create_google_doc, name, parent_folder_id)
 
 
 @mcp.tool()
-def suggest_edit(document_id: str, locator: Dict[str, Any], suggestion_text: str) -> Dict[str, Any]:
+async def suggest_edit(document_id: str, locator: Dict[str, Any], suggestion_text: str) -> Dict[str, Any]:
     """
     Insert and highlight an edit in a Google Doc at a location chosen by `locator`.
 
@@ -525,7 +578,7 @@ def suggest_edit(document_id: str, locator: Dict[str, Any], suggestion_text: str
     - Document indices are UTF-16 code-unit based; concurrent human edits may shift indices
       between read and write operations.
     """
-    return _DRIVE.suggest_edit(document_id, locator, suggestion_text)
+    return await asyncio.to_thread(_get_drive().suggest_edit, document_id, locator, suggestion_text)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
+import io
 import os
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from collections.abc import AsyncIterator
@@ -39,6 +41,41 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 
 mcp = FastMCP("gum", lifespan=app_lifespan)
 
+# ReAct agents often re-issue the same lookup within a few steps; serve those
+# from memory briefly instead of re-running retrieval against the DB. Entries
+# are keyed on the absolute window snapped to a short bucket, and windows that
+# run up to "now" (no end bound) are never cached so live context stays live.
+_CONTEXT_CACHE_TTL_SECONDS = 60.0
+_CONTEXT_WINDOW_BUCKET_SECONDS = 10
+_CONTEXT_CACHE_MAX_ENTRIES = 256
+_context_cache: dict[tuple, tuple[float, str]] = {}
+
+
+def _cache_get(key: tuple) -> Optional[str]:
+    hit = _context_cache.get(key)
+    if hit is None:
+        return None
+    stored_at, value = hit
+    if time.monotonic() - stored_at > _CONTEXT_CACHE_TTL_SECONDS:
+        _context_cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_put(key: tuple, value: str) -> None:
+    if len(_context_cache) >= _CONTEXT_CACHE_MAX_ENTRIES:
+        # dicts keep insertion order: drop the oldest entry
+        _context_cache.pop(next(iter(_context_cache)))
+    _context_cache[key] = (time.monotonic(), value)
+
+
+def _snap(ts: Optional[datetime]) -> Optional[datetime]:
+    """Floor a window bound to the cache bucket so nearby calls share a key."""
+    if ts is None:
+        return None
+    epoch = int(ts.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % _CONTEXT_WINDOW_BUCKET_SECONDS, tz=timezone.utc)
+
 
 @mcp.tool()
 async def get_user_context(
@@ -76,9 +113,20 @@ async def get_user_context(
     if start_hh_mm_ago:
         hours, minutes = map(int, start_hh_mm_ago.split(":"))
         start_time = now - timedelta(hours=hours, minutes=minutes)
+    end_offset = timedelta(0)
     if end_hh_mm_ago:
         hours, minutes = map(int, end_hh_mm_ago.split(":"))
-        end_time = now - timedelta(hours=hours, minutes=minutes)
+        end_offset = timedelta(hours=hours, minutes=minutes)
+        end_time = now - end_offset
+
+    # An end bound of "00:00" is still "up to now": keep it out of the cache too
+    cache_key = None
+    if end_offset > timedelta(0):
+        start_time, end_time = _snap(start_time), _snap(end_time)
+        cache_key = (query or "", start_time, end_time)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
 
     gum_instance = ctx.request_context.lifespan_context.gum_instance
 
@@ -92,26 +140,30 @@ async def get_user_context(
     if not results:
         return "No relevant context found for the given query and time window."
 
-    context_parts = []
+    # Write straight into one buffer instead of building per-entry strings
+    buf = io.StringIO()
     async with gum_instance._session() as session:
-        for proposition, score in results:
-            prop_text = f"• {proposition.text}"
+        for i, (proposition, score) in enumerate(results):
+            if i:
+                buf.write("\n\n")
+            buf.write(f"• {proposition.text}")
             if proposition.reasoning:
-                prop_text += f"\n  Reasoning: {proposition.reasoning}"
+                buf.write(f"\n  Reasoning: {proposition.reasoning}")
             if proposition.confidence:
-                prop_text += f"\n  Confidence: {proposition.confidence}"
-            prop_text += f"\n  Relevance Score: {score:.2f}"
+                buf.write(f"\n  Confidence: {proposition.confidence}")
+            buf.write(f"\n  Relevance Score: {score:.2f}")
 
             # Get and format related observations (limit 1)
             observations = await get_related_observations(session, proposition.id, limit=1)
             if observations:
-                prop_text += "\n  Supporting Observations:"
+                buf.write("\n  Supporting Observations:")
                 for obs in observations:
-                    prop_text += f"\n    - [{obs.observer_name}] {obs.content}"
-
-            context_parts.append(prop_text)
+                    buf.write(f"\n    - [{obs.observer_name}] {obs.content}")
 
-    return "\n\n".join(context_parts)
+    output = buf.getvalue()
+    if cache_key is not None:
+        _cache_put(cache_key, output)
+    return output
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+server = pytest.importorskip("modelgarden.mcp_servers.coder.server")
+
+
+def _trajectory(n: int) -> bytes:
+    # OpenHands writes non-finite floats (e.g. unset costs) as bare NaN/Infinity,
+    # which stdlib json accepts but orjson rejects.
+    entries = ",".join(
+        '{"id": %d, "timestamp": "t%d", "source": "agent", "message": "%s", '
+        '"llm_metrics": {"accumulated_cost": NaN, "latency": Infinity}}' % (i, i, "x" * 3000)
+        for i in range(n)
+    )
+    return ("[" + entries + "]").encode("utf-8")
+
+
+def test_shrink_trajectory_tolerates_nan():
+    raw = _trajectory(60)
+
+    out = server.CodeAgent._shrink_trajectory_json(raw, max_items=40, max_message_chars=100)
+
+    compact = json.loads(out)
+    assert [e["id"] for e in compact] == list(range(20, 60))
+    assert all(e["message"] == "x" * 100 + "...(truncated)" for e in compact)
+    assert len(out) < len(raw) // 10
+
+
+def test_shrink_trajectory_tolerates_lone_surrogates():
+    raw = b'[{"id": 1, "source": "user", "message": "bad \\udcff byte"}]'
+
+    out = server.CodeAgent._shrink_trajectory_json(raw)
+
+    assert json.loads(out)[0]["message"] == "bad \udcff byte"
@@ -0,0 +1,62 @@
+import re
+import threading
+
+from modelgarden.mcp_servers.coder import fast_find
+
+
+def test_ere_escape_matches_name_literally():
+    for name in ["plain-name", "a.b", "c++", "x(1)", "[tag]", "a|b", "^$", "back\\slash", "q?{2}"]:
+        pattern = re.compile("^" + fast_find._ere_escape(name) + "$")
+        assert pattern.fullmatch(name)
+    assert not re.fullmatch(fast_find._ere_escape("a.b"), "axb")
+    assert fast_find._ere_escape("my_repo-2") == "my_repo-2"
+
+
+def test_batch_hits_are_bucketed_by_exact_name(tmp_path, monkeypatch):
+    for rel in ["one/MyRepo", "two/myrepo", "three/myrepo", "three/other"]:
+        (tmp_path / rel).mkdir(parents=True)
+    lines = [
+        str(tmp_path / "one/MyRepo"),
+        str(tmp_path / "two/myrepo") + "/",
+        str(tmp_path / "three/myrepo"),
+        str(tmp_path / "three/other"),
+        str(tmp_path / "missing/myrepo"),
+    ]
+    monkeypatch.setattr(fast_find, "_batch_index_search", lambda names, root, timeout: lines)
+    monkeypatch.setattr(fast_find, "find_folders", lambda *a, **k: [])
+
+    out = fast_find.find_folders_many(["MyRepo", "myrepo"], max_results=5)
+
+    assert out["MyRepo"] == [tmp_path / "one/MyRepo"]
+    assert out["myrepo"] == [tmp_path / "two/myrepo", tmp_path / "three/myrepo"]
+
+
+def test_batch_hits_respect_max_results_per_name(tmp_path, monkeypatch):
+    dirs = [tmp_path / str(i) / "repo" for i in range(4)]
+    for d in dirs:
+        d.mkdir(parents=True)
+    monkeypatch.setattr(fast_find, "_batch_index_search", lambda names, root, timeout: [str(d) for d in dirs])
+
+    out = fast_find.find_folders_many(["repo"], max_results=2)
+
+    assert out["repo"] == dirs[:2]
+
+
+def test_batch_misses_are_all_searched_concurrently(monkeypatch):
+    searched = []
+    barrier = threading.Barrier(3, timeout=2)
+
+    def fake_find_folders(name, **kwargs):
+        searched.append(name)
+        barrier.wait()  # only passes if all three searches run at once
+        return [f"/found/{name}"]
+
+    monkeypatch.setattr(fast_find, "_batch_index_search", lambda names, root, timeout: [])
+    monkeypatch.setattr(fast_find, "find_folders", fake_find_folders)
+
+    out = fast_find.find_folders_many(["a", "b", "c"], timeout=1)
+
+    assert sorted(searched) == ["a", "b", "c"]
+    assert {n: [str(p) for p in hits] for n, hits in out.items()} == {
+        "a": ["/found/a"], "b": ["/found/b"], "c": ["/found/c"],
+    }